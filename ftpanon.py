@@ -2,21 +2,72 @@
 import ftplib
 import argparse
 import logging
-import time
+import logging.handlers
+import queue
+import atexit
 import json
 import socket
+import asyncio
+import random
+import time
+import collections
+import sys
+import os
+import re
 from colorama import Fore, Style
 from tqdm import tqdm
 from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
+try:
+    import uvloop  # Optional: faster drop-in event loop
+except ImportError:
+    uvloop = None
+
+# Console colours; plain text when output is piped to a file or another tool
+_color = sys.stdout.isatty()
+_green = Fore.GREEN if _color else ''
+_red = Fore.RED if _color else ''
+_reset = Style.RESET_ALL if _color else ''
+
+# Per-host console lines, pre-rendered once rather than concatenated per call
+REACHABLE = _green + '[+] {} is reachable.' + _reset
+UNREACHABLE = _red + '[-] {} is not reachable: {}' + _reset
+LOGIN_SUCCEEDED = _green + '[*] {} FTP Anonymous Logon Succeeded. Server response: {}' + _reset
+LOGIN_FAILED = _red + '[-] {} FTP Anonymous Logon Failed: {}' + _reset
+
+# Dotted-quad IPv4 literal; these can skip the resolver entirely
+IPV4_PATTERN = re.compile(r'\d{1,3}(?:\.\d{1,3}){3}$')
+
+# Connect, greeting and login-exchange timeouts, in seconds
+Timeouts = collections.namedtuple('Timeouts', 'connect banner login')
+
+# Login retry backoff, in seconds
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8
+# Only transient failures are worth another login attempt
+RETRIABLE_ERRORS = (socket.timeout, ConnectionResetError, ftplib.error_temp)
+
+# Per-host console lines are flushed once OUTPUT_BATCH of them have queued up
+OUTPUT_BATCH = 64
+output_buffer = []
+
 # Setup logging
 def setup_logging(log_level):
-    logging.basicConfig(
-        filename='ftp_anonymous_login.log',
-        level=log_level,
-        format='%(asctime)s - %(message)s'
-    )
+    # Records go through a queue so the scan never blocks on file I/O.
+    # The message itself is still built in the logging thread (by
+    # QueueHandler); the listener thread adds the timestamp and writes it.
+    file_handler = logging.FileHandler('ftp_anonymous_login.log')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    # Added directly rather than via basicConfig(), which would give the
+    # QueueHandler a "LEVEL:name:" formatter instead of its plain default
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
 
 def print_banner():
     orange = '\033[33m'  # ANSI escape code for orange
@@ -41,9 +92,15 @@ def print_banner():
     Usage:
       -f, --file      File containing the list of IP addresses (default: iplist.txt)
       -t, --timeout   FTP connection timeout in seconds (default: 5)
+      --banner-timeout  Seconds allowed for the server greeting (default: same as --timeout)
+      --login-timeout   Seconds allowed for the anonymous login exchange (default: same as --timeout)
       -r, --retries   Number of retries for failed connections (default: 1)
       --log-level     Set the logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL; default: INFO)
       --check-only    Only check connectivity, do not attempt anonymous logins (default: False)
+      --concurrency   Maximum number of open FTP connections (default: 128)
+      --output-format Summary format: text (summary.txt) or json (summary.json) (default: text)
+      -y, --yes       Skip the confirmation prompt
+      -q, --quiet     Do not print the banner
 
     Example:
       python ftpanon.py -f iplist.txt -t 10 -r 5 --log-level DEBUG --check-only
@@ -54,15 +111,31 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description='Check for anonymous FTP logins.')
     parser.add_argument('-f', '--file', default='iplist.txt', help='File containing list of IP addresses')
     parser.add_argument('-t', '--timeout', type=int, default=5, help='FTP connection timeout in seconds')
+    parser.add_argument('--banner-timeout', type=float, help='Seconds allowed for the server greeting (default: same as --timeout)')
+    parser.add_argument('--login-timeout', type=float, help='Seconds allowed for the anonymous login exchange (default: same as --timeout)')
     parser.add_argument('-r', '--retries', type=int, default=1, help='Number of retries for failed connections')  # Default set to 1
     parser.add_argument('--log-level', default='INFO', help='Set the logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)')
     parser.add_argument('--check-only', action='store_true', help='Only check connectivity, do not attempt anonymous logins')
+    parser.add_argument('--output-format', choices=('text', 'json'), default='text',
+                        help='Summary format: text (summary.txt) or json (summary.json)')
+    parser.add_argument('-y', '--yes', action='store_true', help='Skip the confirmation prompt')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Do not print the banner')
+    parser.add_argument('--concurrency', type=int, default=128,
+                        help='Maximum number of open FTP connections across probing and login (default: 128). '
+                             'Around 256 connections usually maximizes throughput at ~100 ms RTT; going past ~512 '
+                             'tends to run into net.core.somaxconn and ephemeral port exhaustion')
     args = parser.parse_args()
     
     if args.timeout <= 0:
         parser.error("Timeout must be a positive integer.")
+    for name in ('banner_timeout', 'login_timeout'):
+        value = getattr(args, name)
+        if value is not None and value <= 0:
+            parser.error(f"--{name.replace('_', '-')} must be a positive number.")
     if args.retries < 0:
         parser.error("Retries must be a non-negative integer.")
+    if args.concurrency <= 0:
+        parser.error("Concurrency must be a positive integer.")
     
     return args
 
@@ -76,133 +149,451 @@ def load_config(config_file):
                 'retries': config.get('retries', 1)  # Default set to 1
             }
     except FileNotFoundError:
-        print(Fore.RED + "Configuration file not found." + Style.RESET_ALL)
+        print(_red + "Configuration file not found." + _reset)
         return {
             'file': 'iplist.txt',
             'timeout': 5,
             'retries': 1  # Default set to 1
         }
 
-def print_progress_bar(current, total):
-    bar_length = 40
-    progress = int((current / total) * bar_length)
-    bar = f"[{'#' * progress}{'.' * (bar_length - progress)}]"
-    print(f'\r{bar} {current}/{total}', end='')
+def emit(message):
+    # Queue a per-host console line; run_all writes them out in batches
+    output_buffer.append(message)
+
+def flush_output(pbar):
+    if output_buffer:
+        pbar.write('\n'.join(output_buffer))
+        output_buffer.clear()
 
-def check_connectivity(hostname, port=21, timeout=5):
+async def resolve(hostname, port=21):
+    # Dotted-quad input needs no lookup; skip getaddrinfo and its thread hop
+    if IPV4_PATTERN.match(hostname):
+        return hostname, (socket.AF_INET, hostname)
+    loop = asyncio.get_running_loop()
     try:
-        with socket.create_connection((hostname, port), timeout=timeout):
-            print(Fore.GREEN + f'[+] {hostname} is reachable.' + Style.RESET_ALL)
-            return True
-    except (socket.timeout, ConnectionRefusedError) as e:
-        print(Fore.RED + f'[-] {hostname} is not reachable: {e}' + Style.RESET_ALL)
-        return False
+        infos = await loop.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError):
+        return hostname, None
+    family, _, _, _, sockaddr = infos[0]
+    return hostname, (family, sockaddr[0])
+
+async def resolve_all(hosts, port=21):
+    # Resolve every host once up front; probes, logins and retries then
+    # connect straight to the cached IP instead of hitting the resolver again.
+    return dict(await asyncio.gather(*(resolve(host, port) for host in hosts)))
+
+async def fast_probe(address, port=21, timeout=5):
+    # Non-blocking connect; every pending probe waits in the same event loop
+    # selector instead of holding a thread for the full timeout.
+    family, ip = address
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    try:
+        await asyncio.wait_for(asyncio.get_running_loop().sock_connect(sock, (ip, port)), timeout)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+async def check_connectivity(hostnames, address, port=21, timeout=5):
+    # Probes once for all hostnames sharing this address. Returns the
+    # connected socket so the login can reuse it, or None.
+    if address is None:
+        for hostname in hostnames:
+            emit(UNREACHABLE.format(hostname, 'could not resolve host'))
+        return None
+    try:
+        sock = await fast_probe(address, port, timeout)
+    except (asyncio.TimeoutError, OSError) as e:
+        for hostname in hostnames:
+            emit(UNREACHABLE.format(hostname, str(e) or 'timed out'))
+        return None
+    for hostname in hostnames:
+        emit(REACHABLE.format(hostname))
+    return sock
+
+def direct_connect(ip, port, timeout):
+    # Blocking IPv4 connect without the getaddrinfo() pass that
+    # socket.create_connection() makes even for IP literals
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect((ip, port))
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+class FastFTP(ftplib.FTP):
+    # ftplib.FTP with a deadline per protocol phase: the whole banner, and the
+    # whole USER/PASS exchange, must arrive within banner_timeout/login_timeout
+    # rather than each recv() getting the full connection timeout. The budget
+    # is enforced through the socket timeout, since select() can't see data
+    # already buffered by the makefile() reader.
+    deadline = None
+
+    def __init__(self, timeouts):
+        # latin-1 decodes any byte, so a server greeting or replying in a
+        # legacy charset can't raise UnicodeDecodeError mid-login
+        super().__init__(timeout=timeouts.connect, encoding='latin-1')
+        self.banner_timeout = timeouts.banner
+        self.login_timeout = timeouts.login
+
+    def getline(self):
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout('timed out')
+            self.sock.settimeout(remaining)
+        return super().getline()
+
+    def connect(self, host, port=21):
+        if IPV4_PATTERN.match(host):
+            sock = direct_connect(host, port, self.timeout)
+        else:
+            sock = socket.create_connection((host, port), self.timeout)
+        return self.attach(sock, host, port)
+
+    def attach(self, sock, host, port=21):
+        # Adopt an already connected socket, e.g. the one left open by the
+        # connectivity probe; mirrors ftplib.FTP.connect()
+        self.host, self.port = host, port
+        self.sock = sock
+        self.af = sock.family
+        self.file = sock.makefile('r', encoding=self.encoding)
+        self.deadline = time.monotonic() + self.banner_timeout
+        try:
+            self.welcome = self.getresp()
+        finally:
+            self.deadline = None
+        return self.welcome
+
+    def login(self, user='', passwd='', acct=''):
+        self.deadline = time.monotonic() + self.login_timeout
+        try:
+            return super().login(user, passwd, acct)
+        finally:
+            self.deadline = None
+
+def connect_ftp(ip, timeouts, sock=None):
+    ftp = FastFTP(timeouts)
+    try:
+        if sock is None:
+            ftp.connect(ip)
+        else:
+            # Reuse the probe socket instead of paying for a second TCP handshake
+            sock.settimeout(timeouts.connect)
+            ftp.attach(sock, ip)
+    except BaseException:
+        if sock is not None:
+            sock.close()
+        ftp.close()
+        raise
+    return ftp
+
+def anon_login(ip, timeouts, sock=None):
+    # Single blocking login attempt; returns the server's reply to PASS and
+    # the still-open session, which the caller is responsible for closing
+    ftp = connect_ftp(ip, timeouts, sock)
+    try:
+        return ftp.login('anonymous', 'ilove@you.com'), ftp
+    except BaseException:
+        ftp.close()
+        raise
+
+def relogin(ftp):
+    # Log in again over an already authenticated session
+    return ftp.login('anonymous', 'ilove@you.com')
+
+def report_login(hostname, response):
+    emit(LOGIN_SUCCEEDED.format(hostname, response))
+    logging.info('%s FTP Anonymous Logon Succeeded. Server response: %s', hostname, response)
 
-def anonLogin(hostname, timeout, retries):
+def report_login_failure(hostname, response):
+    emit(LOGIN_FAILED.format(hostname, response))
+    logging.info('%s FTP Anonymous Logon Failed. Reason: %s', hostname, response)
+
+def error_response(e):
+    # Capture the server response if available
+    if hasattr(e, 'args') and len(e.args) > 1:
+        return e.args[1]
+    return str(e)
+
+def is_retriable(e):
+    # 421 is a 4xx, but it means the server is shutting us out (too many
+    # connections, service unavailable), so retrying only hammers it
+    return isinstance(e, RETRIABLE_ERRORS) and not str(e).startswith('421')
+
+def backoff_delay(attempt):
+    # Exponential backoff with jitter, capped at RETRY_MAX_DELAY
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+async def anon_login_async(hostname, ip, timeouts, retries, executor, sock=None):
+    # Returns (session, None) on success, or (None, last error) if every
+    # attempt failed
+    loop = asyncio.get_running_loop()
     attempt = 0
+    error = None
     while attempt < retries:
         try:
-            ftp = ftplib.FTP(hostname, timeout=timeout)
-            ftp.login('anonymous', 'ilove@you.com')
-            
-            # Capture and print the server response after login attempt
-            response = ftp.getresp()
-            print(Fore.GREEN + f'\n[*] {hostname} FTP Anonymous Logon Succeeded. Server response: {response}' + Style.RESET_ALL)
-            logging.info(f'{hostname} FTP Anonymous Logon Succeeded. Server response: {response}')
-            
-            ftp.quit()
-            return True
+            # ftplib is blocking, so each attempt runs on a worker thread;
+            # only the first attempt can use the probe socket
+            probe_sock, sock = sock, None
+            response, ftp = await loop.run_in_executor(executor, anon_login, ip, timeouts, probe_sock)
+            report_login(hostname, response)
+            return ftp, None
         except ftplib.all_errors as e:
+            error = e
             attempt += 1
-            if attempt < retries:
-                print(Fore.YELLOW + f'[!] Attempt {attempt}/{retries} failed for {hostname}. Retrying...' + Style.RESET_ALL)
-                time.sleep(2)  # Wait before retrying
+            # A 5xx such as 530, or a 421 closing the connection, will not
+            # change on retry, so give up straight away
+            if is_retriable(e) and attempt < retries:
+                logging.info('%s attempt %d/%d failed (%s). Retrying...', hostname, attempt, retries, e)
+                await asyncio.sleep(backoff_delay(attempt))
             else:
-                # Capture and print server response if available
-                if hasattr(e, 'args') and len(e.args) > 1:
-                    response = e.args[1]
-                else:
-                    response = str(e)
-                print(Fore.RED + f'\n[-] {hostname} FTP Anonymous Logon Failed: {response}' + Style.RESET_ALL)
-                logging.info(f'{hostname} FTP Anonymous Logon Failed. Reason: {response}')
-    return False
-
-def process_host(host, timeout, retries, check_only, results):
-    host = strip_url_prefix(host)
-    if check_connectivity(host):
-        results['reachable'].append(host)
-        if not check_only:
-            if anonLogin(host, timeout, retries):
-                results['anon_login'].append(host)
-            else:
-                results['anon_failures'].append(host)
-    else:
-        results['unreachable'].append(host)
-    print()  # Ensure each result is printed on a new line
+                report_login_failure(hostname, error_response(e))
+                break
+    if sock is not None:
+        sock.close()
+    return None, error
+
+async def relogin_async(hostname, ftp, executor):
+    loop = asyncio.get_running_loop()
+    try:
+        response = await loop.run_in_executor(executor, relogin, ftp)
+    except ftplib.all_errors as e:
+        logging.info('%s re-login over shared connection failed (%s), reconnecting', hostname, e)
+        return False
+    report_login(hostname, response)
+    return True
+
+async def login_group(hosts, ip, sock, executor, timeouts, retries):
+    # Hosts that resolve to the same address (shared hosting, load balancer
+    # VIPs) are logged in over a single control connection, starting with the
+    # probe socket. Returns [(buckets, host), ...].
+    outcomes = []
+    ftp = None
+    reuse_session = True
+    refusal = None
+    for host in hosts:
+        if refusal is not None:
+            # A fresh login to this address already failed for good (refused,
+            # stalled, reset, 421, or out of retries). FTP has no per-hostname
+            # state, so the other hostnames would only repeat that failure.
+            report_login_failure(host, refusal)
+            outcomes.append((('reachable', 'anon_failures'), host))
+            continue
+
+        logged_in = False
+        if ftp is not None:
+            logged_in = await relogin_async(host, ftp, executor)
+            if not logged_in:
+                # The server won't take a second login on one connection;
+                # don't ask again for the rest of the group
+                reuse_session = False
+                ftp.close()
+                ftp = None
+        if not logged_in:
+            probe_sock, sock = sock, None
+            ftp, error = await anon_login_async(host, ip, timeouts, retries, executor, probe_sock)
+            logged_in = ftp is not None
+            if error is not None:
+                refusal = error_response(error)
+            if ftp is not None and not reuse_session:
+                ftp.close()
+                ftp = None
+        outcomes.append((('reachable', 'anon_login' if logged_in else 'anon_failures'), host))
+    if ftp is not None:
+        # Scan-only; we don't need a graceful QUIT/221, so skip that round trip
+        ftp.close()
+    return outcomes
+
+async def probe_worker(probe_q, login_q, result_q, slots, timeout, check_only):
+    # Stage 1: probe each address once and hand reachable ones, with their
+    # open socket, to the login stage. Exits once the probe queue is drained.
+    # Each address holds one of the connection slots from before the probe
+    # until its logins are done, so probing waits while the login stage is behind.
+    while True:
+        try:
+            hosts, address = probe_q.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        await slots.acquire()
+        sock = await check_connectivity(hosts, address, timeout=timeout)
+        if sock is None:
+            slots.release()
+            await result_q.put([(('unreachable',), host) for host in hosts])
+        elif check_only:
+            sock.close()
+            slots.release()
+            await result_q.put([(('reachable',), host) for host in hosts])
+        else:
+            await login_q.put((hosts, address[1], sock))
+
+async def login_worker(login_q, result_q, slots, executor, timeouts, retries):
+    # Stage 2: log in over the probed connections until a None sentinel
+    # arrives, giving each address's connection slot back when done
+    while (item := await login_q.get()) is not None:
+        hosts, ip, sock = item
+        try:
+            outcomes = await login_group(hosts, ip, sock, executor, timeouts, retries)
+        except Exception as e:
+            # An unexpected error costs this group's results, not the whole scan
+            logging.exception('Login check for %s failed unexpectedly', ', '.join(hosts))
+            sock.close()
+            for host in hosts:
+                emit(LOGIN_FAILED.format(host, e))
+            outcomes = [(('reachable', 'anon_failures'), host) for host in hosts]
+        finally:
+            slots.release()
+        await result_q.put(outcomes)
+
+async def run_pipeline(groups, args, result_q, executor, timeouts):
+    # Probing and logging in run as concurrent stages joined by a queue, so
+    # probes for later hosts overlap logins for earlier ones. The shared
+    # slots semaphore keeps open connections across both stages at
+    # --concurrency. Every outcome is put on result_q, followed by a None once done.
+    workers = min(args.concurrency, len(groups))
+    probe_q = asyncio.Queue()
+    for address, hosts in groups.items():
+        probe_q.put_nowait((hosts, address))
+    # Never holds more than --concurrency items, since each one owns a slot
+    login_q = asyncio.Queue()
+    slots = asyncio.Semaphore(args.concurrency)
+
+    login_workers = 0 if args.check_only else workers
+
+    async def probe_stage():
+        await asyncio.gather(*(probe_worker(probe_q, login_q, result_q, slots, timeouts.connect, args.check_only) for _ in range(workers)))
+        for _ in range(login_workers):
+            await login_q.put(None)
+
+    await asyncio.gather(probe_stage(), *(login_worker(login_q, result_q, slots, executor, timeouts, args.retries) for _ in range(login_workers)))
+    await result_q.put(None)
 
 def strip_url_prefix(url):
-    parsed_url = urlparse(url)
-    return parsed_url.hostname if parsed_url.hostname else url
+    # Fast path: most entries are bare IPs
+    _, sep, rest = url.partition('://')
+    if not sep:
+        return url
+    # Hand-rolled split of scheme://[user@]host[:port][/path]; cheaper than
+    # building a ParseResult, with urlparse kept for input this can't handle
+    host = rest.partition('/')[0].partition('?')[0].partition('#')[0].rpartition('@')[2]
+    try:
+        if host.startswith('['):  # IPv6 literal
+            host = host[1:host.index(']')]
+        elif host.count(':') == 1:
+            host = host.partition(':')[0]
+    except ValueError:
+        try:
+            parsed_url = urlparse(url)
+        except ValueError:
+            return url
+        return parsed_url.hostname if parsed_url.hostname else url
+    return host.lower() if host else url
 
 def confirm_action(prompt):
     response = input(prompt).lower()
     return response in ('y', 'yes')
 
 def load_hosts(file_path):
+    # Generator: streams the file line by line instead of reading it whole,
+    # yielding each host once even if it is listed several times
+    found = False
+    seen = set()
     try:
         with open(file_path, 'r') as file:
-            content = file.read().strip()
-            if not content:
-                print(Fore.RED + "Error: IP list is empty." + Style.RESET_ALL)
-                print("Instructions for Adding IP Addresses:")
-                print("1. Open the file specified with -f or --file.")
-                print("2. Add each IP address on a new line or separate them with commas.")
-                print("   Example:")
-                print("   192.168.1.1")
-                print("   192.168.1.2, 192.168.1.3")
-                print("3. Save the file and re-run the script.")
-                return []
-            else:
-                hosts = [host.strip() for host in content.replace(',', '\n').splitlines()]
-                # Handle URLs with prefixes
-                return [strip_url_prefix(host) for host in hosts]
+            for line in file:
+                for host in line.split(','):
+                    host = host.strip()
+                    if host:
+                        found = True
+                        # Handle URLs with prefixes
+                        host = strip_url_prefix(host)
+                        if host not in seen:
+                            seen.add(host)
+                            yield host
     except FileNotFoundError:
-        print(Fore.RED + f"Error: File {file_path} not found." + Style.RESET_ALL)
-        return []
-
-def save_summary(results):
-    with open('summary.txt', 'w') as file:
-        file.write("Summary of FTP Anonymous Login Scan\n")
-        file.write("="*40 + "\n\n")
-
-        file.write(Fore.GREEN + "Reachable IPs:\n" + Style.RESET_ALL)
-        for ip in results['reachable']:
-            file.write(f'[+] {ip}\n')
-        
-        file.write(Fore.RED + "\nUnreachable IPs:\n" + Style.RESET_ALL)
-        for ip in results['unreachable']:
-            file.write(f'[-] {ip}\n')
-        
-        file.write(Fore.GREEN + "\nIPs with Successful Anonymous Logins:\n" + Style.RESET_ALL)
-        for ip in results['anon_login']:
-            file.write(f'[+] {ip}\n')
-        
-        file.write(Fore.RED + "\nIPs with Failed Anonymous Logins:\n" + Style.RESET_ALL)
-        for ip in results['anon_failures']:
-            file.write(f'[-] {ip}\n')
-
-    print(Fore.GREEN + "Summary saved to 'summary.txt'" + Style.RESET_ALL)
+        print(_red + f"Error: File {file_path} not found." + _reset)
+        return
+    if not found:
+        print(_red + "Error: IP list is empty." + _reset)
+        print("Instructions for Adding IP Addresses:")
+        print("1. Open the file specified with -f or --file.")
+        print("2. Add each IP address on a new line or separate them with commas.")
+        print("   Example:")
+        print("   192.168.1.1")
+        print("   192.168.1.2, 192.168.1.3")
+        print("3. Save the file and re-run the script.")
+
+def save_summary(results, output_format='text'):
+    path = 'summary.json' if output_format == 'json' else 'summary.txt'
+    # Write to a temporary file and swap it in, so an interrupted run never
+    # leaves a half-written summary behind
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', buffering=1 << 20) as file:
+        if output_format == 'json':
+            json.dump(results, file, separators=(',', ':'))
+        else:
+            file.write("Summary of FTP Anonymous Login Scan\n")
+            file.write("="*40 + "\n\n")
+
+            file.write("Reachable IPs:\n")
+            file.writelines(f'[+] {ip}\n' for ip in results['reachable'])
+
+            file.write("\nUnreachable IPs:\n")
+            file.writelines(f'[-] {ip}\n' for ip in results['unreachable'])
+
+            file.write("\nIPs with Successful Anonymous Logins:\n")
+            file.writelines(f'[+] {ip}\n' for ip in results['anon_login'])
+
+            file.write("\nIPs with Failed Anonymous Logins:\n")
+            file.writelines(f'[-] {ip}\n' for ip in results['anon_failures'])
+    os.replace(tmp_path, path)
+
+    print(_green + f"Summary saved to '{path}'" + _reset)
+
+async def run_all(hosts, args, results):
+    addr_map = await resolve_all(hosts)
+    groups = collections.defaultdict(list)
+    for host in hosts:
+        groups[addr_map[host]].append(host)
+
+    timeouts = Timeouts(args.timeout, args.banner_timeout or args.timeout, args.login_timeout or args.timeout)
+    result_q = asyncio.Queue()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        # Fixed width and bar format so tqdm doesn't re-measure the terminal on every refresh
+        with tqdm(total=len(hosts), desc="Progress", disable=not sys.stderr.isatty(),
+                  bar_format='{l_bar}{bar:40}{r_bar}', ncols=100, smoothing=0,
+                  miniters=max(1, len(hosts) // 1000), mininterval=0.5, maxinterval=5) as pbar:
+            async def collect():
+                while (outcomes := await result_q.get()) is not None:
+                    for buckets, host in outcomes:
+                        for bucket in buckets:
+                            results[bucket].append(host)
+                    if len(output_buffer) >= OUTPUT_BATCH:
+                        flush_output(pbar)
+                    pbar.update(len(outcomes))
+                flush_output(pbar)
+
+            # gather() so a failure in either side ends the scan instead of
+            # leaving collect() waiting for a sentinel that never comes
+            await asyncio.gather(run_pipeline(groups, args, result_q, executor, timeouts), collect())
 
 def main():
     args = parse_arguments()
     setup_logging(args.log_level.upper())
-    print_banner()
+    if sys.stdout.isatty() and not args.quiet:
+        print_banner()
 
-    if not confirm_action("Do you want to proceed with the scan? (y/n): "):
-        print("Exiting...")
-        return
+    # Only prompt when someone is there to answer; redirected stdin proceeds
+    if sys.stdin.isatty() and not args.yes:
+        if not confirm_action("Do you want to proceed with the scan? (y/n): "):
+            print("Exiting...")
+            return
 
-    hosts = load_hosts(args.file)
+    # The host count is needed up front for DNS pre-resolution and the progress bar
+    hosts = list(load_hosts(args.file))
     if not hosts:
         return
 
@@ -214,13 +605,12 @@ def main():
     }
 
     print("Processing IPs...")
-    with ThreadPoolExecutor() as executor:
-        futures = [executor.submit(process_host, host, args.timeout, args.retries, args.check_only, results) for host in hosts]
-        for _ in tqdm(as_completed(futures), total=len(futures), desc="Progress"):
-            pass
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(run_all(hosts, args, results))
 
-    print(Fore.GREEN + "\nProcessing complete." + Style.RESET_ALL)
-    save_summary(results)
+    print(_green + "\nProcessing complete." + _reset)
+    save_summary(results, args.output_format)
 
 if __name__ == '__main__':
     main()